@@ -16,6 +16,11 @@ from pdf_outliner.core import PDFOutliner
 
 def cli() -> None:
     """Command-line interface for PDF Outliner."""
+    from dotenv import load_dotenv
+
+    # Load .env before building the parser, whose defaults read DEFAULT_MODEL
+    load_dotenv()
+
     parser = argparse.ArgumentParser(
         description="Add AI-generated bookmarks to PDFs based on detected headings"
     )
@@ -39,6 +44,24 @@ def cli() -> None:
         type=str,
         help="Additional guidance for the AI about what kind of outline to produce",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["pypdf", "playa"],
+        default="pypdf",
+        help="Text extraction backend (default: pypdf; playa requires the 'playa' extra)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for text extraction (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the LLM instead of reusing cached outlines",
+    )
     parser.add_argument(
         "--show-outline",
         action="store_true",
@@ -54,7 +77,12 @@ def cli() -> None:
 
     # Create outliner and process
     try:
-        outliner = PDFOutliner(model=args.model)
+        outliner = PDFOutliner(
+            model=args.model,
+            backend=args.backend,
+            use_cache=not args.no_cache,
+            workers=args.workers,
+        )
         outline = outliner.process_pdf(args.input_pdf, args.output, guidance=args.guidance)
 
         # Optionally print the outline
@@ -8,15 +8,285 @@ Core functionality for PDF Outliner
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
+import multiprocessing
+import os
+import re
 import sys
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Coroutine, Final, Generator, Iterable, TypeVar
+from weakref import WeakKeyDictionary
 
-import litellm
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
-from pypdf import PdfReader, PdfWriter
+from pydantic import BaseModel, Field, ValidationError
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import NameObject
+
+
+_T = TypeVar("_T")
+
+# Directory holding cached LLM outlines, keyed by a hash of model and prompts
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "pdf-outliner"
+
+# Static instructions sent as the system message of every request. They never vary,
+# so providers can cache them as the prompt prefix.
+SYSTEM_PROMPT: Final[str] = """You are a document analysis assistant. Your task is to identify all headings in a document and create an outline.
+
+Analyze the provided document text and identify:
+1. Main headings and subheadings
+2. Their hierarchical level (1 = main heading, 2 = subheading, etc.)
+3. The page number where each heading appears (indicated by PAGE markers)
+
+Guidelines:
+- Level 1: Main chapter/section titles
+- Level 2: Major subsections
+- Level 3+: Nested subsections
+- Ignore headers/footers, page numbers, and running titles
+- Focus on actual content structure
+- Be conservative - only include clear headings
+
+Return exactly one JSON object with a "headings" array. Do not return a bare JSON array.
+Each heading in the array has:
+- title: the heading text
+- level: hierarchical level (1-6)
+- page: page number where it appears"""
+
+# Three or more consecutive line breaks, collapsed before prompting
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+# Number of lines at the top and bottom of a page searched for running headers/footers
+_RUNNING_LINE_DEPTH = 3
+
+# Fewest pages in a chunk for repeated lines to count as running headers/footers
+_MIN_PAGES_FOR_RUNNING_LINES = 3
+
+# Upper bound on the tokens held back for the model's reply; an outline never needs
+# a model's full output window
+_OUTPUT_TOKEN_RESERVE = 16384
+
+# Share of the input window left unused, as token counts are estimates for many models
+_TOKEN_SAFETY_FRACTION = 0.1
+
+# Fewest pages for which text extraction is spread across worker processes
+_MIN_PAGES_FOR_WORKERS = 16
+
+# Tokens reserved for prompt tags and message framing when budgeting chunks
+_PROMPT_TOKEN_MARGIN = 256
+
+# Locks serializing access to readers, which are shared through _get_reader but not thread-safe
+_reader_locks: WeakKeyDictionary[PdfReader, threading.Lock] = WeakKeyDictionary()
+_reader_locks_guard = threading.Lock()
+
+# Reader opened once per worker process by _init_extraction_worker
+_worker_reader: PdfReader | None = None
+
+
+@lru_cache(maxsize=16)
+def _get_reader(path: str, mtime_ns: int) -> PdfReader:
+    """Parse a PDF once per (path, modification time) pair."""
+    return PdfReader(path, strict=False)
+
+
+def _open_reader(pdf_path: Path) -> PdfReader:
+    """Return a cached reader for the PDF, reparsing it only after it changes on disk."""
+    return _get_reader(str(pdf_path.resolve()), pdf_path.stat().st_mtime_ns)
+
+
+def _reader_lock(reader: PdfReader) -> threading.Lock:
+    """Return the lock to hold while using a reader, as it may be shared between threads."""
+    with _reader_locks_guard:
+        return _reader_locks.setdefault(reader, threading.Lock())
+
+
+def _init_extraction_worker(pdf_path: Path) -> None:
+    """Open the PDF once in each worker process."""
+    global _worker_reader
+    _worker_reader = PdfReader(pdf_path, strict=False)
+
+
+def _extract_page_text(page_index: int) -> str:
+    """Extract the text of a single page using the worker's reader."""
+    assert _worker_reader is not None
+    return _extract_plain_text(_worker_reader.pages[page_index])
+
+
+def _extract_plain_text(page: PageObject) -> str:
+    """
+    Extract a page's text without layout reconstruction, as the LLM needs no positioning.
+
+    Only upright text is read unless the page has none, e.g. when it is rotated.
+    """
+    text = page.extract_text(extraction_mode="plain", orientations=(0,))
+    if not text.strip():
+        text = page.extract_text(extraction_mode="plain")
+    return text
+
+
+def _run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    When called from a thread that already runs an event loop (e.g. Jupyter or an
+    async host), the coroutine is run on its own loop in a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _aiter_pages(pages: Iterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    """Present already extracted pages as an asynchronous stream."""
+    for page_data in pages:
+        yield page_data
+
+
+def _strip_running_lines(pages: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """
+    Remove running headers and footers from a run of pages.
+
+    A line among the first or last few lines of a page is treated as a header or
+    footer when it appears there on more than half of the pages. Its first
+    occurrence is kept, as that is often the actual heading or title. Pages too
+    short to have separate edges are neither counted nor stripped.
+
+    Args:
+        pages: Page numbers and texts
+
+    Returns:
+        The pages with their running lines removed
+    """
+    page_lines = [text.splitlines() for _, text in pages]
+    edges = []
+    for lines in page_lines:
+        if len(lines) > 2 * _RUNNING_LINE_DEPTH:
+            edge = {line.strip() for line in lines[:_RUNNING_LINE_DEPTH] + lines[-_RUNNING_LINE_DEPTH:]}
+            edge.discard("")
+        else:
+            edge = set()
+        edges.append(edge)
+
+    eligible = sum(1 for lines in page_lines if len(lines) > 2 * _RUNNING_LINE_DEPTH)
+    if eligible < _MIN_PAGES_FOR_RUNNING_LINES:
+        return pages
+
+    counts: Counter[str] = Counter()
+    for edge in edges:
+        counts.update(edge)
+
+    running = {line for line, count in counts.items() if count > eligible / 2}
+    if not running:
+        return pages
+
+    seen: set[str] = set()
+    stripped = []
+    for (page_num, text), lines, edge in zip(pages, page_lines, edges):
+        if not edge & running:
+            stripped.append((page_num, text))
+            continue
+
+        last = len(lines) - _RUNNING_LINE_DEPTH
+        kept = []
+        for i, line in enumerate(lines):
+            key = line.strip()
+            if (i < _RUNNING_LINE_DEPTH or i >= last) and key in running:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(line)
+        stripped.append((page_num, "\n".join(kept)))
+
+    return stripped
+
+
+class _ChunkBuilder:
+    """
+    Groups page texts into page-bounded chunks no larger than a size limit.
+
+    Consecutive chunks share one page where it fits, so a heading at a chunk
+    boundary is seen together with the text that follows it. Running headers and
+    footers are removed from each chunk when it is finished.
+    """
+
+    def __init__(self, limit: int, size: Callable[[str], int]):
+        """
+        Initialize the chunk builder.
+
+        Args:
+            limit: Maximum size of a chunk
+            size: Function measuring the size of a piece of text
+        """
+        self.limit = limit
+        self.size = size
+        self.pages: list[tuple[int, str]] = []
+        self.total = 0
+
+    def add(self, page_num: int, text: str) -> str | None:
+        """
+        Add the text of one page.
+
+        Args:
+            page_num: The page number
+            text: The page text
+
+        Returns:
+            The previous chunk if this page did not fit into it, otherwise None
+        """
+        chunk = None
+        part_size = self.size(self._format_page(page_num, text))
+        if self.pages and self.total + part_size > self.limit:
+            last_page = self.pages[-1]
+            chunk = self.flush()
+
+            # Repeat the last page at the start of the next chunk
+            last_size = self.size(self._format_page(*last_page))
+            if last_size + part_size <= self.limit:
+                self.pages.append(last_page)
+                self.total = last_size
+
+        # A single page larger than a whole chunk still has to be cut. Sizes need not
+        # scale with length (e.g. tokens), so keep cutting until the page fits.
+        if part_size > self.limit:
+            room = self.limit - self.size(self._format_page(page_num, ""))
+            while text and part_size > self.limit:
+                text_size = max(part_size - self.limit + room, 1)
+                keep = min(len(text) * max(room, 0) // text_size, len(text) - 1)
+                text = text[:keep]
+                part_size = self.size(self._format_page(page_num, text))
+        self.pages.append((page_num, text))
+        self.total += part_size
+
+        return chunk
+
+    def flush(self) -> str | None:
+        """
+        Finish the current chunk.
+
+        Returns:
+            The chunk text, or None if no pages were added since the last chunk
+        """
+        if not self.pages:
+            return None
+
+        chunk = "".join(self._format_page(page_num, text) for page_num, text in _strip_running_lines(self.pages))
+        self.pages = []
+        self.total = 0
+        return chunk
+
+    @staticmethod
+    def _format_page(page_num: int, text: str) -> str:
+        """Prefix page text with the page marker the LLM uses to report page numbers."""
+        return f"\n--- PAGE {page_num} ---\n{text}"
 
 
 class Heading(BaseModel):
@@ -36,34 +306,155 @@ class DocumentOutline(BaseModel):
 class PDFOutliner:
     """Analyzes PDFs and adds bookmarks based on detected headings."""
 
-    def __init__(self, model: str = "gemini/gemini-3.1-flash-lite"):
+    # Maximum characters of document text sent in a single LLM request, used when
+    # the model's token window is unknown to LiteLLM.
+    # 2 million characters, with a context window of 1 million tokens that should be safe.
+    # Longer documents are split into several requests that run concurrently.
+    max_chars = 2000000
+
+    # Maximum number of LLM requests in flight at once, to stay within provider rate limits
+    max_concurrent_requests = 4
+
+    def __init__(
+        self,
+        model: str = "gemini/gemini-3.1-flash-lite",
+        backend: str = "pypdf",
+        use_cache: bool = True,
+        workers: int = 1,
+    ):
         """
         Initialize the PDF outliner.
 
         Args:
             model: The LiteLLM model to use for analysis
+            backend: Text extraction backend, either "pypdf" or "playa"
+            use_cache: Reuse outlines from previous identical LLM requests
+            workers: Worker processes for pypdf text extraction. Values above 1 start
+                a process pool, which re-imports the calling script's __main__ module on
+                some platforms, so scripts must then guard their entry point with
+                ``if __name__ == "__main__":``
         """
+        if backend not in ("pypdf", "playa"):
+            raise ValueError(f"Unknown extraction backend: {backend}")
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
         self.model = model
-        load_dotenv()
+        self.backend = backend
+        self.use_cache = use_cache
+        self.workers = workers
 
-    def extract_text_with_pages(self, pdf_path: Path) -> list[dict[str, Any]]:
+    def extract_text_with_pages(self, pdf_path: Path) -> tuple[PdfReader | None, list[dict[str, Any]]]:
         """
         Extract text from PDF with page information.
 
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            The PdfReader used for extraction (None for the playa backend, which
+            does not open one) and a list of dictionaries containing page number and text
+        """
+        reader, pages = self._iter_text_with_pages(pdf_path)
+        return reader, list(pages)
+
+    def extract_text_with_pages_playa(self, pdf_path: Path) -> list[dict[str, Any]]:
+        """
+        Extract text from PDF with page information using PLAYA.
+
         Args:
             pdf_path: Path to the PDF file
 
         Returns:
             List of dictionaries containing page number and text
         """
-        reader = PdfReader(pdf_path)
-        pages = []
+        return list(self._iter_playa_pages(pdf_path))
 
-        for page_num, page in enumerate(reader.pages, start=1):
-            text = page.extract_text()
-            pages.append({"page": page_num, "text": text})
+    def _iter_text_with_pages(self, pdf_path: Path) -> tuple[PdfReader | None, Generator[dict[str, Any], None, None]]:
+        """
+        Open the PDF and lazily extract its pages in order with the configured backend.
 
-        return pages
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            The PdfReader used for extraction (None for the playa backend) and an
+            iterator of dictionaries containing page number and text
+        """
+        if self.backend == "playa":
+            return None, self._iter_playa_pages(pdf_path)
+
+        reader = _open_reader(pdf_path)
+        return reader, self._iter_pypdf_pages(reader, pdf_path)
+
+    def _iter_pypdf_pages(self, reader: PdfReader, pdf_path: Path) -> Generator[dict[str, Any], None, None]:
+        """
+        Extract pages with pypdf, yielding each one as soon as it is available.
+
+        Args:
+            reader: Reader opened on pdf_path
+            pdf_path: Path to the PDF file, opened again by worker processes
+
+        Yields:
+            Dictionaries containing page number and text
+        """
+        lock = _reader_lock(reader)
+        with lock:
+            page_count = len(reader.pages)
+        # Every worker parses the whole PDF again, which only pays off for longer documents
+        workers = min(self.workers, page_count) if page_count >= _MIN_PAGES_FOR_WORKERS else 1
+
+        # Text extraction is CPU-bound pure Python, so spread pages across processes.
+        # Workers receive the path rather than the file contents and open it themselves.
+        # This may run on a helper thread while other threads are active, so workers are
+        # started from a forkserver (or spawned where that is unavailable, e.g. Windows)
+        # rather than by forking this process.
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(
+                    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                ),
+                initializer=_init_extraction_worker,
+                initargs=(pdf_path,),
+            )
+            try:
+                chunksize = max(1, page_count // (workers * 4))
+                texts = executor.map(_extract_page_text, range(page_count), chunksize=chunksize)
+                for page_num, text in enumerate(texts, start=1):
+                    yield {"page": page_num, "text": text}
+            finally:
+                # Drop pages not yet started when the consumer stops early
+                executor.shutdown(cancel_futures=True)
+        else:
+            for page_index in range(page_count):
+                # Lock per page rather than for the whole run, so concurrent callers
+                # interleave instead of waiting for each other's full extraction
+                with lock:
+                    text = _extract_plain_text(reader.pages[page_index])
+                yield {"page": page_index + 1, "text": text}
+
+    def _iter_playa_pages(self, pdf_path: Path) -> Generator[dict[str, Any], None, None]:
+        """
+        Extract pages with PLAYA, yielding each one as soon as it is available.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Yields:
+            Dictionaries containing page number and text
+        """
+        try:
+            import playa
+        except ImportError as e:
+            raise RuntimeError(
+                "The playa backend requires the optional 'playa' extra: "
+                "pip install 'pdf-outliner[playa]'"
+            ) from e
+
+        with playa.open(pdf_path) as doc:
+            for page_num, page in enumerate(doc.pages, start=1):
+                yield {"page": page_num, "text": page.extract_text()}
 
     def analyze_pdf_with_llm(self, pages: list[dict[str, Any]], guidance: str | None = None) -> DocumentOutline:
         """
@@ -75,79 +466,305 @@ class PDFOutliner:
         Returns:
             DocumentOutline containing detected headings
         """
-        # Prepare the document text with page markers
-        document_text = ""
-        for page_data in pages:
-            document_text += f"\n--- PAGE {page_data['page']} ---\n"
-            document_text += page_data["text"]
+        return _run_sync(self.aanalyze_pdf_with_llm(pages, guidance=guidance))
+
+    async def aanalyze_pdf_with_llm(
+        self,
+        pages: list[dict[str, Any]],
+        guidance: str | None = None,
+    ) -> DocumentOutline:
+        """
+        Analyze PDF text using LLM to detect headings, one concurrent request per chunk.
+
+        Args:
+            pages: List of page dictionaries with text
+
+        Returns:
+            DocumentOutline containing detected headings
+        """
+        chunks = self._chunk_builder(guidance)
+        return await self._analyze_page_stream(_aiter_pages(pages), guidance, chunks)
 
-        # Truncate if too long (keep within context limits)
-        # 2 million characters, with a context window of 1 million tokens that should be safe.
-        max_chars = 2000000  
-        if len(document_text) > max_chars:
-            document_text = document_text[:max_chars] + "\n\n[Document truncated...]"
+    async def _analyze_page_stream(
+        self,
+        pages: AsyncIterator[dict[str, Any]],
+        guidance: str | None,
+        chunks: _ChunkBuilder,
+    ) -> DocumentOutline:
+        """
+        Analyze pages as they arrive, sending each chunk to the LLM as soon as it is full.
 
-        system_prompt = """You are a document analysis assistant. Your task is to identify all headings in a document and create an outline.
+        A failed request stops the analysis at the next page rather than after the
+        whole document has been read, so no further chunks are sent.
 
-Analyze the provided document text and identify:
-1. Main headings and subheadings
-2. Their hierarchical level (1 = main heading, 2 = subheading, etc.)
-3. The page number where each heading appears (indicated by PAGE markers)
+        Args:
+            pages: Stream of page dictionaries with text, in page order
+            guidance: Additional guidance for the LLM
+            chunks: Empty chunk builder from _chunk_builder
 
-Guidelines:
-- Level 1: Main chapter/section titles
-- Level 2: Major subsections
-- Level 3+: Nested subsections
-- Ignore headers/footers, page numbers, and running titles
-- Focus on actual content structure
-- Be conservative - only include clear headings
+        Returns:
+            DocumentOutline containing detected headings
+        """
+        # Load API keys only once LLM work is actually requested
+        from dotenv import load_dotenv
 
-Return exactly one JSON object with a "headings" array. Do not return a bare JSON array."""
+        load_dotenv()
 
-        guidance_section = f"{guidance}\n" if guidance else ""
+        tasks: list[asyncio.Task[DocumentOutline]] = []
 
-        user_prompt = f"""Analyze this document and extract all headings with their levels and page numbers:
+        requests = asyncio.Semaphore(self.max_concurrent_requests)
 
-<document>
-{document_text}
-</document>
+        async def analyze(chunk: str) -> DocumentOutline:
+            async with requests:
+                return await self._analyze_chunk(chunk, guidance)
 
-{guidance_section}
-Return a JSON object with a "headings" array where each heading has:
-- title: the heading text
-- level: hierarchical level (1-6)
-- page: page number where it appears"""
+        def dispatch(chunk: str) -> None:
+            tasks.append(asyncio.create_task(analyze(chunk)))
+
+        def raise_failed() -> None:
+            for task in tasks:
+                if task.done() and not task.cancelled() and (exc := task.exception()) is not None:
+                    raise exc
+
+        try:
+            async for page_data in pages:
+                raise_failed()
+
+                # Blank and image-only pages only add markers without content, and long
+                # runs of empty lines carry no structure, so neither is sent to the model
+                if not page_data["text"].strip():
+                    continue
+
+                chunk = chunks.add(page_data["page"], _BLANK_LINES.sub("\n\n", page_data["text"]))
+                if chunk is not None:
+                    dispatch(chunk)
+
+            chunk = chunks.flush()
+            if chunk is not None or not tasks:
+                dispatch(chunk or "")
+
+            outlines = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return self._merge_outlines(outlines)
+
+    def _chunk_builder(self, guidance: str | None) -> _ChunkBuilder:
+        """
+        Create a chunk builder sized to fit the model's context.
+
+        Chunks are measured in tokens against the model's input window when LiteLLM
+        knows it, and in characters against max_chars otherwise.
+
+        Args:
+            guidance: Additional guidance for the LLM, counted against the token budget
+
+        Returns:
+            An empty _ChunkBuilder
+        """
+        import litellm
+
+        try:
+            model_info = litellm.get_model_info(self.model)
+        except Exception:
+            model_info = {}
+
+        max_input_tokens = model_info.get("max_input_tokens")
+        if not max_input_tokens:
+            return _ChunkBuilder(self.max_chars, len)
+
+        def size(text: str) -> int:
+            return litellm.token_counter(model=self.model, text=text)
+
+        # Leave room for the reply, the system prompt, the guidance and message framing.
+        # Token counts may come from a fallback tokenizer, so keep a proportional margin too.
+        output_reserve = min(model_info.get("max_output_tokens") or _OUTPUT_TOKEN_RESERVE, _OUTPUT_TOKEN_RESERVE)
+        limit = (
+            int(max_input_tokens * (1 - _TOKEN_SAFETY_FRACTION))
+            - output_reserve
+            - size(SYSTEM_PROMPT)
+            - size(guidance or "")
+            - _PROMPT_TOKEN_MARGIN
+        )
+        if limit <= 0:
+            raise ValueError(
+                f"The context window of {self.model} ({max_input_tokens} tokens) leaves no room "
+                "for document text; use a model with a larger context or shorter guidance"
+            )
+
+        return _ChunkBuilder(limit, size)
+
+    async def _analyze_chunk(
+        self,
+        document_text: str,
+        guidance: str | None,
+    ) -> DocumentOutline:
+        """
+        Detect the headings in a single chunk of the document.
+
+        Args:
+            document_text: Chunk of document text with page markers
+            guidance: Additional guidance for the LLM
+
+        Returns:
+            DocumentOutline containing the headings found in the chunk
+        """
+        # litellm is slow to import, so it is only loaded when a request is made
+        import litellm
+
+        document_section = "".join(("<document>\n", document_text, "\n</document>"))
+        guidance_section = f"\n\nAdditional guidance:\n{guidance}" if guidance else ""
+        user_prompt = document_section + guidance_section
+
+        cache_key = hashlib.sha256(
+            "\0".join((self.model, SYSTEM_PROMPT, user_prompt)).encode("utf-8")
+        ).hexdigest()
+        if self.use_cache:
+            cached = self._load_cached_outline(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            response = litellm.completion(
+            response = await litellm.acompletion(
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format={"type": "json_object"},
+                messages=self._build_messages(document_section, guidance_section),
+                # Passing the model makes LiteLLM request the provider's native
+                # structured output, so the response already matches its JSON schema
+                response_format=DocumentOutline,
                 temperature=0.1,
             )
 
-            # Parse the response
             content = response.choices[0].message.content
-            data = json.loads(content)
-
-            # Some providers return the headings array directly despite JSON mode.
-            # Normalize that equivalent response before validating its contents.
-            if isinstance(data, list):
-                data = {"headings": data}
-
-            return DocumentOutline.model_validate(data)
+            try:
+                outline = DocumentOutline.model_validate_json(content)
+            except ValidationError:
+                # Some providers (or models LiteLLM cannot send a schema to) return the
+                # headings array directly. Normalize that equivalent response instead.
+                data = json.loads(content)
+                if not isinstance(data, list):
+                    raise
+                outline = DocumentOutline.model_validate({"headings": data})
 
         except Exception as e:
             raise RuntimeError(f"Error analyzing PDF with LLM: {e}") from e
 
+        if self.use_cache:
+            self._store_cached_outline(cache_key, outline)
+
+        return outline
+
+    def _merge_outlines(self, outlines: list[DocumentOutline]) -> DocumentOutline:
+        """
+        Combine per-chunk outlines in order, dropping repeated headings.
+
+        Headings on the page shared by two chunks are reported twice, and the model
+        occasionally repeats one within a chunk, so duplicates are always removed.
+
+        Args:
+            outlines: Outlines of consecutive chunks
+
+        Returns:
+            The merged DocumentOutline
+        """
+        seen = set()
+        headings = []
+        for outline in outlines:
+            for heading in outline.headings:
+                key = (heading.title.lower().strip(), heading.page)
+                if key not in seen:
+                    seen.add(key)
+                    headings.append(heading)
+
+        return DocumentOutline(headings=headings)
+
+    def _load_cached_outline(self, cache_key: str) -> DocumentOutline | None:
+        """
+        Load a previously cached outline.
+
+        Args:
+            cache_key: Hash identifying the LLM request
+
+        Returns:
+            The cached DocumentOutline, or None if missing or unreadable
+        """
+        try:
+            return DocumentOutline.model_validate_json((CACHE_DIR / f"{cache_key}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_outline(self, cache_key: str, outline: DocumentOutline) -> None:
+        """
+        Atomically write an outline to the cache. Failures are reported but not fatal.
+
+        Args:
+            cache_key: Hash identifying the LLM request
+            outline: The outline returned for that request
+        """
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                    tmp_file.write(outline.model_dump_json())
+                os.replace(tmp_path, CACHE_DIR / f"{cache_key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not write outline cache: {e}", file=sys.stderr)
+
+    def _build_messages(self, document_section: str, guidance_section: str) -> list[dict[str, Any]]:
+        """
+        Build the chat messages, marking the cacheable prefix where required.
+
+        Prompts are ordered static-first, dynamic-last so providers can cache the
+        shared prefix: the system message never changes, the document follows it,
+        and the per-run guidance comes last. OpenAI and Gemini cache matching
+        prefixes automatically. Anthropic only caches up to an explicit
+        cache_control breakpoint and needs at least 1024 tokens before it, which
+        the system prompt alone does not reach, so the breakpoint goes after the
+        document.
+
+        Args:
+            document_section: The document text wrapped in document tags
+            guidance_section: The additional guidance, or an empty string
+
+        Returns:
+            The system and user messages
+        """
+        import litellm
+
+        try:
+            _, provider, _, _ = litellm.get_llm_provider(self.model)
+        except Exception:
+            provider = None
+
+        if provider != "anthropic":
+            user_content: str | list[dict[str, Any]] = document_section + guidance_section
+        else:
+            user_content = [
+                {
+                    "type": "text",
+                    "text": document_section,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+            if guidance_section:
+                user_content.append({"type": "text", "text": guidance_section.lstrip()})
+
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ]
+
     def add_bookmarks_to_pdf(
         self,
         input_path: Path,
         output_path: Path,
         outline: DocumentOutline,
+        reader: PdfReader | None = None,
     ) -> None:
         """
         Add bookmarks to PDF based on the detected outline.
@@ -156,16 +773,27 @@ Return a JSON object with a "headings" array where each heading has:
             input_path: Path to input PDF
             output_path: Path to save output PDF with bookmarks
             outline: DocumentOutline with headings to add
+            reader: Already opened reader for input_path, to avoid parsing it again
         """
-        reader = PdfReader(input_path)
-        writer = PdfWriter()
-
-        # Add all pages
-        for page in reader.pages:
-            writer.add_page(page)
-
-        # Track parent bookmarks for nested structure
-        parent_stack: list[Any] = [None]  # Stack to track parent bookmarks by level
+        # Clone the whole document instead of copying page by page, so content
+        # streams are carried over untouched and only the outline changes
+        if reader is None:
+            reader = _open_reader(input_path)
+        with _reader_lock(reader):
+            # Leave any existing bookmarks out of the clone: the new outline replaces
+            # them, and cloned ones would still be written as unreferenced objects.
+            # The reader is cached, so its catalog is restored afterwards.
+            catalog = reader.trailer["/Root"].get_object()
+            old_outline = catalog.pop("/Outlines", None)
+            try:
+                writer = PdfWriter(clone_from=reader)
+            finally:
+                if old_outline is not None:
+                    catalog[NameObject("/Outlines")] = old_outline
+
+        # Parent bookmark for each heading level, indexed by level - 1.
+        # Entry 0 stays None so level 1 headings are top-level.
+        parents: list[Any] = [None] * 7
 
         for heading in outline.headings:
             page_num = heading.page - 1  # Convert to 0-based index
@@ -179,32 +807,18 @@ Return a JSON object with a "headings" array where each heading has:
                 )
                 continue
 
-            # Adjust parent stack to current level
-            # Ensure we have the right parent for this level
-            while len(parent_stack) > heading.level:
-                parent_stack.pop()
-
-            # Get parent (None for top-level, or the bookmark at level-1)
-            parent = parent_stack[-1] if len(parent_stack) > 0 else None
-
-            # Add bookmark
             bookmark = writer.add_outline_item(
                 title=heading.title,
                 page_number=page_num,
-                parent=parent,
+                parent=parents[heading.level - 1],
             )
 
-            # Update stack: ensure we have exactly heading.level items
-            while len(parent_stack) < heading.level:
-                parent_stack.append(parent_stack[-1])
+            # This bookmark is the parent of every deeper level, so headings that
+            # skip a level still nest under their nearest ancestor
+            parents[heading.level :] = [bookmark] * (7 - heading.level)
 
-            if len(parent_stack) == heading.level:
-                parent_stack.append(bookmark)
-            else:
-                parent_stack[heading.level] = bookmark
-
-        # Write output PDF
-        with open(output_path, "wb") as output_file:
+        # Write output PDF through a large buffer to cut down on write syscalls
+        with open(output_path, "wb", buffering=4 * 1024 * 1024) as output_file:
             writer.write(output_file)
 
     def process_pdf(
@@ -216,6 +830,30 @@ Return a JSON object with a "headings" array where each heading has:
         """
         Complete workflow: extract text, analyze, and add bookmarks.
 
+        Args:
+            input_path: Path to input PDF
+            output_path: Path to output PDF (defaults to input_path with '_outlined' suffix)
+
+        Returns:
+            DocumentOutline with detected headings
+        """
+        return _run_sync(self.aprocess_pdf(input_path, output_path, guidance=guidance))
+
+    async def aprocess_pdf(
+        self,
+        input_path: Path,
+        output_path: Path | None = None,
+        guidance: str | None = None,
+    ) -> DocumentOutline:
+        """
+        Complete workflow: extract text, analyze, and add bookmarks.
+
+        Extraction runs in a worker thread and each chunk of pages is sent to the
+        LLM as soon as it is extracted, so extraction overlaps with the LLM calls.
+        This only helps documents that span several chunks; with the default chunk
+        sizes most documents fit into one, whose request starts after extraction.
+        Any failure stops extraction at the next page.
+
         Args:
             input_path: Path to input PDF
             output_path: Path to output PDF (defaults to input_path with '_outlined' suffix)
@@ -226,16 +864,53 @@ Return a JSON object with a "headings" array where each heading has:
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_outlined.pdf"
 
-        print(f"[*] Reading PDF: {input_path}")
-        pages = self.extract_text_with_pages(input_path)
-        print(f"    Found {len(pages)} pages")
+        # Checked before any page is read, so a prompt that cannot fit fails immediately
+        chunks = self._chunk_builder(guidance)
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict[str, Any] | BaseException | None] = asyncio.Queue()
+        stop = threading.Event()
+
+        def extract() -> PdfReader | None:
+            # Runs in a worker thread; errors are handed to the consumer through the queue
+            try:
+                reader, pages = self._iter_text_with_pages(input_path)
+                with contextlib.closing(pages):
+                    for page_data in pages:
+                        if stop.is_set():
+                            return None
+                        loop.call_soon_threadsafe(queue.put_nowait, page_data)
+            except BaseException as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+                return None
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+            return reader
+
+        page_count = 0
+
+        async def extracted_pages() -> AsyncIterator[dict[str, Any]]:
+            nonlocal page_count
+            while (item := await queue.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                page_count += 1
+                yield item
 
-        print(f"\n[*] Analyzing with {self.model}...")
-        outline = self.analyze_pdf_with_llm(pages, guidance=guidance)
+        print(f"[*] Reading PDF: {input_path}")
+        print(f"[*] Analyzing with {self.model}...")
+        extraction = asyncio.create_task(asyncio.to_thread(extract))
+        try:
+            outline = await self._analyze_page_stream(extracted_pages(), guidance, chunks)
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            reader = await extraction
+        print(f"    Found {page_count} pages")
         print(f"    Detected {len(outline.headings)} headings")
 
         print(f"\n[*] Adding bookmarks to PDF...")
-        self.add_bookmarks_to_pdf(input_path, output_path, outline)
+        await asyncio.to_thread(self.add_bookmarks_to_pdf, input_path, output_path, outline, reader=reader)
         print(f"    [OK] Saved to: {output_path}")
 
         return outline